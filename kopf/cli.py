@@ -15,6 +15,7 @@ from kopf.utilities import loaders
 @dataclasses.dataclass()
 class CLIControls:
     """ `KopfRunner` controls, which are impossible to pass via CLI. """
+    loop: Optional[asyncio.AbstractEventLoop] = None
     ready_flag: Optional[primitives.Flag] = None
     stop_flag: Optional[primitives.Flag] = None
     vault: Optional[credentials.Vault] = None
@@ -53,6 +54,21 @@ def logging_options(fn: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
+def install_uvloop() -> None:
+    """
+    Switch to the uvloop's event loop policy if uvloop is installed.
+
+    uvloop is optional: ``pip install kopf[uvloop]``. If it is not installed,
+    the default asyncio event loop of the current Python is used as usual.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 @click.version_option(prog_name='kopf')
 @click.group(name='kopf', context_settings=dict(
     auto_envvar_prefix='KOPF',
@@ -83,6 +99,8 @@ def run(
         liveness_endpoint: Optional[str],
 ) -> None:
     """ Start an operator process and handle all the requests. """
+    if __controls.loop is None:
+        install_uvloop()
     if __controls.registry is not None:
         registries.set_default_registry(__controls.registry)
     loaders.preload(
@@ -90,6 +108,7 @@ def run(
         modules=modules,
     )
     return running.run(
+        loop=__controls.loop,
         standalone=standalone,
         namespace=namespace,
         priority=priority,
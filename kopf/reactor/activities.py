@@ -16,8 +16,10 @@ The process is intentionally split into multiple packages:
 * Specific authentication methods, such as the authentication piggybacking,
   belong to neither the reactor, nor the engines, nor the client wrappers.
 """
+import asyncio
+import functools
 import logging
-from typing import Mapping, MutableMapping, NoReturn
+from typing import Dict, Mapping, NoReturn
 
 from kopf.reactor import causation, effects, handling, lifecycles, registries
 from kopf.storage import states
@@ -46,15 +48,24 @@ async def authenticator(
         vault: credentials.Vault,
 ) -> NoReturn:
     """ Keep the credentials forever up to date. """
-    counter: int = 1 if vault else 0
+
+    # Log initial and re-authentications differently, for readability.
+    # A pre-populated vault (e.g. from the legacy login) needs no initial authentication.
+    if not vault:
+        await authenticate(
+            registry=registry,
+            settings=settings,
+            vault=vault,
+            _activity_title="Initial authentication",
+        )
     while True:
         await authenticate(
             registry=registry,
             settings=settings,
             vault=vault,
-            _activity_title="Re-authentication" if counter else "Initial authentication",
+            _activity_title="Re-authentication",
+            _debounced=True,
         )
-        counter += 1
 
 
 async def authenticate(
@@ -63,11 +74,22 @@ async def authenticate(
         settings: configuration.OperatorSettings,
         vault: credentials.Vault,
         _activity_title: str = "Authentication",
+        _debounced: bool = False,
 ) -> None:
     """ Retrieve the credentials once, successfully or not, and exit. """
 
     # Sleep most of the time waiting for a signal to re-auth.
-    await vault.wait_for_emptiness()
+    # On re-auth, let other API clients invalidate their credentials too, and re-auth for all
+    # of them at once. The initial authentication has nothing to coalesce, so it is not delayed.
+    # If the vault has been re-populated meanwhile (e.g. by other means), wait for the next signal,
+    # and debounce it again -- the same as the first one.
+    while True:
+        await vault.wait_for_emptiness()
+        if not _debounced or settings.batching.reauth_debounce <= 0:
+            break
+        await asyncio.sleep(settings.batching.reauth_debounce)
+        if not vault:
+            break
 
     # Log initial and re-authentications differently, for readability.
     logger.info(f"{_activity_title} has been initiated.")
@@ -77,6 +99,7 @@ async def authenticate(
         registry=registry,
         settings=settings,
         activity=handlers_.Activity.AUTHENTICATION,
+        concurrent=True,
     )
 
     if activity_results:
@@ -86,7 +109,7 @@ async def authenticate(
                        f"no credentials were retrieved from the login handlers.")
 
     # Feed the credentials into the vault, and unfreeze the re-authenticating clients.
-    await vault.populate({str(handler_id): info for handler_id, info in activity_results.items()})
+    await vault.populate(activity_results)
 
 
 async def run_activity(
@@ -95,38 +118,55 @@ async def run_activity(
         registry: registries.OperatorRegistry,
         settings: configuration.OperatorSettings,
         activity: handlers_.Activity,
+        concurrent: bool = False,
 ) -> Mapping[handlers_.HandlerId, callbacks.Result]:
-    logger = logging.getLogger(f'kopf.activities.{activity.value}')
+    handlers = registry.activity_handlers.get_handlers(activity=activity)
+    if not handlers:
+        return {}
 
     # For the activity handlers, we have neither bodies, nor patches, just the state.
+    logger = _get_activity_logger(activity)
     cause = causation.ActivityCause(logger=logger, activity=activity, settings=settings)
-    handlers = registry.activity_handlers.get_handlers(activity=activity)
     state = states.State.from_scratch().with_handlers(handlers)
-    outcomes: MutableMapping[handlers_.HandlerId, states.HandlerOutcome] = {}
-    while not state.done:
+    outcomes: Dict[handlers_.HandlerId, states.HandlerOutcome] = {}
+    while True:
         current_outcomes = await handling.execute_handlers_once(
             lifecycle=lifecycle,
             settings=settings,
             handlers=handlers,
             cause=cause,
             state=state,
+            concurrent=concurrent,
         )
         outcomes.update(current_outcomes)
         state = state.with_outcomes(current_outcomes)
-        await effects.sleep_or_wait(state.delay)
+
+        # No delays mean that all handlers are finished, i.e. the state is done (activities have
+        # no purposes to filter by). Check it in one pass over the handlers instead of two.
+        # Sleep for the retry delays, if any. For no delays, only let other tasks run.
+        delay = state.delay
+        if delay is None:
+            break
+        elif delay > 0:
+            await effects.sleep_or_wait(delay)
+        else:
+            await asyncio.sleep(0)
 
     # Activities assume that all handlers must eventually succeed.
     # We raise from the 1st exception only: just to have something real in the tracebacks.
     # For multiple handlers' errors, the logs should be investigated instead.
-    exceptions = [outcome.exception
-                  for outcome in outcomes.values()
-                  if outcome.exception is not None]
-    if exceptions:
-        raise ActivityError("One or more handlers failed.", outcomes=outcomes) from exceptions[0]
-
     # If nothing has failed, we return identifiable results. The outcomes/states are internal.
     # The order of results is not guaranteed (the handlers can succeed on one of the retries).
-    results = {handler_id: outcome.result
-               for handler_id, outcome in outcomes.items()
-               if outcome.result is not None}
+    results: Dict[handlers_.HandlerId, callbacks.Result] = {}
+    for handler_id, outcome in outcomes.items():
+        if outcome.exception is not None:
+            raise ActivityError("One or more handlers failed.", outcomes=outcomes) from outcome.exception
+        if outcome.result is not None:
+            results[handler_id] = outcome.result
     return results
+
+
+@functools.lru_cache(maxsize=None)
+def _get_activity_logger(activity: handlers_.Activity) -> logging.Logger:
+    # There are only few activities, but the authenticator runs its activity forever.
+    return logging.getLogger(f'kopf.activities.{activity.value}')
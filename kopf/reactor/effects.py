@@ -155,10 +155,14 @@ async def sleep_or_wait(
     if minimal_delay <= 0:
         return None
 
+    # Nothing can interrupt the sleep, so there is no need to wait for an event that is never set.
+    if wakeup is None:
+        await asyncio.sleep(minimal_delay)
+        return None
+
     awakening_event = (
         wakeup.async_event if isinstance(wakeup, primitives.DaemonStopper) else
-        wakeup if wakeup is not None else
-        asyncio.Event())
+        wakeup)
 
     loop = asyncio.get_running_loop()
     try:
@@ -11,7 +11,7 @@ import asyncio
 import collections.abc
 import logging
 from contextvars import ContextVar
-from typing import Any, Collection, Iterable, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Awaitable, Collection, Dict, Iterable, Mapping, Optional, Set, Union
 
 from kopf.engines import loggers
 from kopf.reactor import causation, invocation, lifecycles, registries
@@ -186,6 +186,7 @@ async def execute_handlers_once(
         cause: causation.BaseCause,
         state: states.State,
         default_errors: handlers_.ErrorsMode = handlers_.ErrorsMode.TEMPORARY,
+        concurrent: bool = False,
 ) -> Mapping[handlers_.HandlerId, states.HandlerOutcome]:
     """
     Call the next handler(s) from the chain of the handlers.
@@ -195,16 +196,19 @@ async def execute_handlers_once(
 
     This routine is used both for the global handlers (via global registry),
     and for the sub-handlers (via a simple registry of the current handler).
+
+    If ``concurrent`` is true, the planned handlers are executed concurrently
+    rather than one after another. This is only safe for the handlers that are
+    independent of each other (e.g. the login handlers), and do not share
+    the patch of the object.
     """
 
     # Filter and select the handlers to be executed right now, on this event reaction cycle.
     handlers_todo = [h for h in handlers if state[h.id].awakened]
     handlers_plan = lifecycle(handlers_todo, **invocation.build_kwargs(cause=cause, state=state))
 
-    # Execute all planned (selected) handlers in one event reaction cycle, even if there are few.
-    outcomes: MutableMapping[handlers_.HandlerId, states.HandlerOutcome] = {}
-    for handler in handlers_plan:
-        outcome = await execute_handler_once(
+    def execute(handler: handlers_.BaseHandler) -> Awaitable[states.HandlerOutcome]:
+        return execute_handler_once(
             settings=settings,
             handler=handler,
             state=state[handler.id],
@@ -212,7 +216,20 @@ async def execute_handlers_once(
             lifecycle=lifecycle,  # just a default for the sub-handlers, not used directly.
             default_errors=default_errors,
         )
-        outcomes[handler.id] = outcome
+
+    # Execute all planned (selected) handlers in one event reaction cycle, even if there are few.
+    outcomes: Dict[handlers_.HandlerId, states.HandlerOutcome] = {}
+    if concurrent:
+        # A failed handler does not cancel its siblings; the escalations are re-raised, but later.
+        results = await asyncio.gather(*[execute(handler) for handler in handlers_plan],
+                                       return_exceptions=True)
+        for handler, result in zip(handlers_plan, results):
+            if isinstance(result, BaseException):
+                raise result
+            outcomes[handler.id] = result
+    else:
+        for handler in handlers_plan:
+            outcomes[handler.id] = await execute(handler)
 
     return outcomes
 
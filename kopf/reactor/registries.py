@@ -17,8 +17,9 @@ import enum
 import functools
 import warnings
 from types import FunctionType, MethodType
-from typing import Any, Callable, Collection, Container, FrozenSet, Generic, Iterable, Iterator, \
-                   List, Mapping, MutableMapping, Optional, Sequence, Set, TypeVar, Union, cast
+from typing import Any, Callable, Collection, Container, Dict, FrozenSet, \
+                   Generic, Iterable, Iterator, List, Mapping, MutableMapping, \
+                   Optional, Sequence, Set, TypeVar, Union, cast
 
 from kopf.reactor import causation, invocation
 from kopf.structs import callbacks, dicts, filters, handlers, resources as resources_
@@ -60,6 +61,15 @@ class GenericRegistry(Generic[HandlerFnT, HandlerT]):
 class ActivityRegistry(GenericRegistry[
         callbacks.ActivityFn,
         handlers.ActivityHandler]):
+    _cache: Dict[handlers.Activity, Sequence[handlers.ActivityHandler]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cache = {}
+
+    def append(self, handler: handlers.ActivityHandler) -> None:
+        super().append(handler)
+        self._cache.clear()
 
     def register(
             self,
@@ -90,7 +100,14 @@ class ActivityRegistry(GenericRegistry[
             self,
             activity: handlers.Activity,
     ) -> Sequence[handlers.ActivityHandler]:
-        return list(_deduplicated(self.iter_handlers(activity=activity)))
+        # The handlers are registered rarely (mostly at startup), but are requested
+        # on every activity run, e.g. on every re-authentication. So, we cache them.
+        # DEPRECATED: the legacy generic calls can pass causes instead of activities: no caching.
+        if not isinstance(activity, handlers.Activity):
+            return list(_deduplicated(self.iter_handlers(activity=activity)))
+        if activity not in self._cache:
+            self._cache[activity] = tuple(_deduplicated(self.iter_handlers(activity=activity)))
+        return self._cache[activity]
 
     def iter_handlers(
             self,
@@ -224,12 +224,12 @@ class State(Mapping[handlers_.HandlerId, HandlerState]):
         if unknown_ids:
             raise RuntimeError(f"Unexpected outcomes for unknown handlers: {unknown_ids!r}")
 
+        # Only the handlers with outcomes are re-created, all others are copied as is (C-level).
+        handler_states: Dict[handlers_.HandlerId, HandlerState] = dict(self._states)
+        for handler_id, outcome in outcomes.items():
+            handler_states[handler_id] = handler_states[handler_id].with_outcome(outcome)
         cls = type(self)
-        return cls({
-            handler_id: (handler_state if handler_id not in outcomes else
-                         handler_state.with_outcome(outcomes[handler_id]))
-            for handler_id, handler_state in self.items()
-        }, purpose=self.purpose)
+        return cls(handler_states, purpose=self.purpose)
 
     def store(
             self,
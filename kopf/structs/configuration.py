@@ -203,6 +203,17 @@ class BatchingSettings:
     This is the time given to the worker to deplete and process the queue.
     """
 
+    reauth_debounce: float = 0.05
+    """
+    How long to wait after the credentials are depleted before re-authenticating.
+
+    The credentials are usually invalidated by many API clients at once
+    (e.g. when a token expires); all such invalidations arriving within this
+    window are served by one single re-authentication (one login activity).
+
+    Set to ``0`` to re-authenticate instantly.
+    """
+
     error_delays: Iterable[float] = (1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610)
     """
     Backoff intervals in case of unexpected errors in the framework (not the handlers).
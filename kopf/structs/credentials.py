@@ -63,6 +63,7 @@ class ConnectionInfo:
 
 
 _T = TypeVar('_T', bound=object)
+_StrKeyT = TypeVar('_StrKeyT', bound=str)  # e.g. HandlerId or VaultKey
 
 # Usually taken from the HandlerId (also a string), but semantically it is on its own.
 VaultKey = NewType('VaultKey', str)
@@ -260,7 +261,7 @@ class Vault(AsyncIterable[Tuple[VaultKey, ConnectionInfo]]):
 
     async def populate(
             self,
-            __src: Mapping[str, object],
+            __src: Mapping[_StrKeyT, object],
     ) -> None:
         """
         Add newly retrieved credentials.
@@ -268,6 +269,9 @@ class Vault(AsyncIterable[Tuple[VaultKey, ConnectionInfo]]):
         Used by :func:`authentication` to add newly retrieved credentials
         from the authentication activity handlers. Some of the credentials
         can be duplicates of the existing ones -- only one of them is used then.
+
+        The keys can be any strings, e.g. the handler ids as they are returned
+        from the activity; they are used as the vault keys as is.
         """
 
         # Remember the new info items (or replace the old ones). If we already see that the item
@@ -328,10 +332,10 @@ class Vault(AsyncIterable[Tuple[VaultKey, ConnectionInfo]]):
 
     def _update_converted(
             self,
-            __src: Mapping[str, object],
+            __src: Mapping[_StrKeyT, object],
     ) -> None:
-        for key, info in __src.items():
-            key = VaultKey(str(key))
+        for src_key, info in __src.items():
+            key = VaultKey(src_key)
             if not isinstance(info, ConnectionInfo):
                 raise ValueError("Only ConnectionInfo instances are currently accepted.")
             if info not in [data.info for data in self._invalid[key]]:
@@ -1,21 +1,128 @@
+import dataclasses
 import urllib.parse
-from typing import List, Mapping, NamedTuple, Optional
+import warnings
+import weakref
+from typing import Any, ClassVar, Iterator, Mapping, Optional, Tuple, Union, overload
 
 
 # An immutable reference to a custom resource definition.
-class Resource(NamedTuple):
+# It is a slotted class rather than a dataclass: the dataclasses cannot have both
+# the slots and the non-init fields in Python < 3.10, and we need both here.
+# The instances are interned: the same resource is the same object while it is referenced.
+# It used to be a NamedTuple, so the tuple protocol (iteration, indexing, ordering, ``_replace()``)
+# is kept for compatibility. The equality to plain tuples is deprecated; it is not a tuple anymore.
+class Resource:
+    __slots__ = ('group', 'version', 'plural', 'name', 'api_version', '_url_prefix', '_hash',
+                 '__weakref__')
+    _instances: ClassVar["weakref.WeakValueDictionary[Tuple[Any, ...], Resource]"]
+    _instances = weakref.WeakValueDictionary()
+
     group: str
     version: str
     plural: str
 
-    @property
-    def name(self) -> str:
-        return f'{self.plural}.{self.group}'.strip('.')
+    # Derived from the fields above once, as they are used in every API call.
+    name: str
+    api_version: str
+    _url_prefix: str
+
+    # The resources are the dict keys on every watch-event, so the hash is also computed only once.
+    _hash: int
+
+    def __new__(cls, group: str, version: str, plural: str) -> "Resource":
+        key = (cls, group, version, plural)
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        # The instances are frozen, so we have to bypass our own protection to initialise.
+        # Strip heading/trailing slashes & dots if group is absent (e.g. for pods).
+        url_prefix = '/api' if group == '' and version == 'v1' else '/apis'
+        url_prefix = '/'.join([part for part in [url_prefix, group, version] if part])
+        instance = super().__new__(cls)
+        object.__setattr__(instance, 'group', group)
+        object.__setattr__(instance, 'version', version)
+        object.__setattr__(instance, 'plural', plural)
+        object.__setattr__(instance, 'name', f'{plural}.{group}'.strip('.'))
+        object.__setattr__(instance, 'api_version', f'{group}/{version}'.strip('/'))
+        object.__setattr__(instance, '_url_prefix', url_prefix)
+        object.__setattr__(instance, '_hash', hash((group, version, plural)))
+        cls._instances[key] = instance
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.group, self.version, self.plural)
+
+    def __repr__(self) -> str:
+        cls_name = type(self).__name__
+        return f'{cls_name}(group={self.group!r}, version={self.version!r}, plural={self.plural!r})'
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Resource):
+            return (self.group == other.group and
+                    self.version == other.version and
+                    self.plural == other.plural)
+        if isinstance(other, tuple):
+            warnings.warn("Comparing kopf.Resource to tuples is deprecated; "
+                          "compare to kopf.Resource or its fields.", DeprecationWarning)
+            return self._as_tuple() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Resource):
+            return NotImplemented
+        return self._as_tuple() < other._as_tuple()
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Resource):
+            return NotImplemented
+        return self._as_tuple() <= other._as_tuple()
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Resource):
+            return NotImplemented
+        return self._as_tuple() > other._as_tuple()
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Resource):
+            return NotImplemented
+        return self._as_tuple() >= other._as_tuple()
+
+    def __len__(self) -> int:
+        return 3
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._as_tuple())
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[str, ...]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, Tuple[str, ...]]:
+        return self._as_tuple()[index]
+
+    def _replace(self, **kwargs: str) -> "Resource":
+        fields = dict(group=self.group, version=self.version, plural=self.plural)
+        unknown = set(kwargs) - set(fields)
+        if unknown:
+            raise ValueError(f"Got unexpected field names: {sorted(unknown)!r}")
+        return type(self)(**{**fields, **kwargs})
 
-    @property
-    def api_version(self) -> str:
-        # Strip heading/trailing slashes if group is absent (e.g. for pods).
-        return f'{self.group}/{self.version}'.strip('/')
+    def _as_tuple(self) -> Tuple[str, str, str]:
+        return (self.group, self.version, self.plural)
 
     def get_url(
             self,
@@ -29,16 +136,19 @@ class Resource(NamedTuple):
         if subresource is not None and name is None:
             raise ValueError("Subresources can be used only with specific resources by their name.")
 
-        return self._build_url(server, params, [
-            '/api' if self.group == '' and self.version == 'v1' else '/apis',
-            self.group,
-            self.version,
-            'namespaces' if namespace is not None else None,
-            namespace,
-            self.plural,
-            name,
-            subresource,
-        ])
+        # Same as joining all the non-empty parts, but without the intermediate lists & filtering.
+        parts = [self._url_prefix]
+        if namespace is not None:
+            parts.append('namespaces')
+        if namespace:
+            parts.append(namespace)
+        if self.plural:
+            parts.append(self.plural)
+        if name:
+            parts.append(name)
+        if subresource:
+            parts.append(subresource)
+        return self._build_url(server, params, '/'.join(parts))
 
     def get_version_url(
             self,
@@ -46,19 +156,13 @@ class Resource(NamedTuple):
             server: Optional[str] = None,
             params: Optional[Mapping[str, str]] = None,
     ) -> str:
-        return self._build_url(server, params, [
-            '/api' if self.group == '' and self.version == 'v1' else '/apis',
-            self.group,
-            self.version,
-        ])
+        return self._build_url(server, params, self._url_prefix)
 
     def _build_url(
             self,
             server: Optional[str],
             params: Optional[Mapping[str, str]],
-            parts: List[Optional[str]],
+            path: str,
     ) -> str:
-        query = urllib.parse.urlencode(params, encoding='utf-8') if params else ''
-        path = '/'.join([part for part in parts if part])
-        url = path + ('?' if query else '') + query
+        url = f'{path}?{urllib.parse.urlencode(params, encoding="utf-8")}' if params else path
         return url if server is None else server.rstrip('/') + '/' + url.lstrip('/')
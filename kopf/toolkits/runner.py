@@ -126,6 +126,7 @@ class KopfRunner(_AbstractKopfRunner):
         # Remember the result & exception for re-raising in the parent thread.
         try:
             ctxobj = cli.CLIControls(
+                loop=loop,
                 registry=self.registry,
                 settings=self.settings,
                 stop_flag=self._stop)
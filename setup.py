@@ -50,4 +50,9 @@ setup(
         'aiojobs',
         'pykube-ng>=0.27',  # used only for config parsing
     ],
+    extras_require={
+        'uvloop': [
+            'uvloop',
+        ],
+    },
 )
@@ -1,8 +1,10 @@
+import asyncio
+
 import pytest
 
-from kopf.reactor.activities import authenticate
+from kopf.reactor.activities import authenticate, authenticator
 from kopf.reactor.registries import OperatorRegistry
-from kopf.structs.credentials import ConnectionInfo, LoginError, Vault
+from kopf.structs.credentials import ConnectionInfo, LoginError, Vault, VaultKey
 from kopf.structs.handlers import Activity, ActivityHandler
 
 
@@ -76,3 +78,139 @@ async def test_single_credentials_provided_to_vault(settings):
     assert len(items) == 1
     assert items[0][0] == 'login_fn'
     assert items[0][1] is info
+
+
+async def test_reauth_is_debounced_until_repopulated(settings, mocker):
+    info = ConnectionInfo(server='https://expected/')
+    vault = Vault()
+    registry = OperatorRegistry()
+    login_fn = mocker.Mock(return_value=info)
+    settings.batching.reauth_debounce = 0.2
+
+    # NB: id auto-detection does not work, as it is local to the test function.
+    registry.activity_handlers.append(ActivityHandler(
+        fn=login_fn, id='login_fn', activity=Activity.AUTHENTICATION,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+
+    task = asyncio.create_task(authenticate(
+        registry=registry,
+        settings=settings,
+        vault=vault,
+        _debounced=True,
+    ))
+    try:
+        await asyncio.sleep(0.1)  # within the debounce window
+        await vault.populate({'other': ConnectionInfo(server='https://other/')})
+        await asyncio.sleep(0.2)  # beyond the debounce window
+        assert not task.done()
+        assert not login_fn.called
+    finally:
+        task.cancel()
+        await asyncio.wait([task])
+
+
+async def test_reauth_is_debounced_again_after_repopulation(settings, mocker):
+    info = ConnectionInfo(server='https://expected/')
+    vault = Vault()
+    registry = OperatorRegistry()
+    login_fn = mocker.Mock(return_value=info)
+    settings.batching.reauth_debounce = 0.2
+
+    # NB: id auto-detection does not work, as it is local to the test function.
+    registry.activity_handlers.append(ActivityHandler(
+        fn=login_fn, id='login_fn', activity=Activity.AUTHENTICATION,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+
+    task = asyncio.create_task(authenticate(
+        registry=registry,
+        settings=settings,
+        vault=vault,
+        _debounced=True,
+    ))
+    invalidation = None
+    try:
+        await asyncio.sleep(0.1)  # within the debounce window
+        await vault.populate({'other': ConnectionInfo(server='https://other/')})
+        await asyncio.sleep(0.2)  # beyond the debounce window
+        invalidation = asyncio.create_task(vault.invalidate(VaultKey('other')))
+        await asyncio.sleep(0.1)  # within the new debounce window
+        assert not login_fn.called
+        await asyncio.sleep(0.2)  # beyond the new debounce window
+        assert login_fn.called
+        await asyncio.wait_for(task, timeout=1.0)
+    finally:
+        task.cancel()
+        if invalidation is not None:
+            invalidation.cancel()
+        await asyncio.wait([t for t in [task, invalidation] if t is not None])
+
+
+async def test_initial_authentication_is_not_debounced(settings, mocker):
+    info = ConnectionInfo(server='https://expected/')
+    vault = Vault()
+    registry = OperatorRegistry()
+    login_fn = mocker.Mock(return_value=info)
+    settings.batching.reauth_debounce = 10
+
+    # NB: id auto-detection does not work, as it is local to the test function.
+    registry.activity_handlers.append(ActivityHandler(
+        fn=login_fn, id='login_fn', activity=Activity.AUTHENTICATION,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+
+    task = asyncio.create_task(authenticator(
+        registry=registry,
+        settings=settings,
+        vault=vault,
+    ))
+    try:
+        await asyncio.wait_for(vault.wait_for_readiness(), timeout=1.0)
+        assert login_fn.call_count == 1
+    finally:
+        task.cancel()
+        await asyncio.wait([task])
+
+
+@pytest.mark.parametrize('prepopulated, expected_titles', [
+    pytest.param(False, ["Initial authentication", "Re-authentication"], id='empty'),
+    pytest.param(True, ["Re-authentication", "Re-authentication"], id='prepopulated'),
+])
+async def test_authenticator_logs_initial_and_reauthentication(
+        settings, caplog, prepopulated, expected_titles):
+    caplog.set_level(0)
+    vault = Vault({'initial': ConnectionInfo(server='https://initial/')} if prepopulated else None)
+    registry = OperatorRegistry()
+    settings.batching.reauth_debounce = 0
+    servers = iter(['https://first/', 'https://second/', 'https://third/'])
+
+    def login_fn(**_):
+        return ConnectionInfo(server=next(servers))
+
+    # NB: id auto-detection does not work, as it is local to the test function.
+    registry.activity_handlers.append(ActivityHandler(
+        fn=login_fn, id='login_fn', activity=Activity.AUTHENTICATION,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+
+    task = asyncio.create_task(authenticator(
+        registry=registry,
+        settings=settings,
+        vault=vault,
+    ))
+    try:
+        await asyncio.sleep(0.01)  # let the authenticator start and see the initial vault
+        for _ in range(len(expected_titles) - (0 if prepopulated else 1)):
+            async for key, _ in vault:
+                await vault.invalidate(key)
+                break
+        await vault.wait_for_readiness()
+    finally:
+        task.cancel()
+        await asyncio.wait([task])
+
+    titles = [message[:-len(" has been initiated.")]
+              for message in caplog.messages
+              if message.endswith(" has been initiated.")]
+    assert titles == expected_titles
@@ -1,3 +1,8 @@
+import copy
+import gc
+import pickle
+import weakref
+
 import pytest
 
 from kopf.structs.resources import Resource
@@ -30,6 +35,90 @@ def test_creation_with_all_kwargs():
     assert resource.plural == 'plural'
 
 
+def test_equality_and_hashing_by_fields_only():
+    resource1 = Resource('group', 'version', 'plural')
+    resource2 = Resource('group', 'version', 'plural')
+    assert resource1 == resource2
+    assert hash(resource1) == hash(resource2)
+    assert repr(resource1) == "Resource(group='group', version='version', plural='plural')"
+
+
+def test_immutability():
+    resource = Resource('group', 'version', 'plural')
+    with pytest.raises(AttributeError):
+        resource.group = 'other'
+
+
+def test_interning_of_same_resources():
+    resource1 = Resource('group', 'version', 'plural')
+    resource2 = Resource(group='group', version='version', plural='plural')
+    resource3 = Resource('group', 'version', 'other')
+    assert resource1 is resource2
+    assert resource1 is not resource3
+
+
+def test_interning_does_not_keep_unused_resources():
+    resource = Resource('group', 'version', 'plural-unused')
+    ref = weakref.ref(resource)
+    del resource
+    gc.collect()
+    assert ref() is None
+
+
+def test_no_instance_dict():
+    resource = Resource('group', 'version', 'plural')
+    assert not hasattr(resource, '__dict__')
+
+
+def test_pickling_and_copying():
+    resource = Resource('group', 'version', 'plural')
+    for restored in [pickle.loads(pickle.dumps(resource)), copy.copy(resource), copy.deepcopy(resource)]:
+        assert restored == resource
+        assert restored.name == 'plural.group'
+        assert restored.api_version == 'group/version'
+        assert restored.get_url() == '/apis/group/version/plural'
+
+
+def test_tuple_protocol_compatibility():
+    resource = Resource('group', 'version', 'plural')
+    group, version, plural = resource
+    assert (group, version, plural) == ('group', 'version', 'plural')
+    assert tuple(resource) == ('group', 'version', 'plural')
+    assert len(resource) == 3
+    assert resource[0] == 'group'
+    assert resource[-1] == 'plural'
+    assert resource[1:] == ('version', 'plural')
+
+
+def test_ordering_compatibility():
+    resource1 = Resource('group', 'version', 'plural1')
+    resource2 = Resource('group', 'version', 'plural2')
+    assert resource1 < resource2
+    assert resource1 <= resource2
+    assert resource2 > resource1
+    assert resource2 >= resource1
+    assert sorted([resource2, resource1]) == [resource1, resource2]
+
+
+def test_replacing_fields_compatibility():
+    resource = Resource('group', 'version', 'plural')
+    replaced = resource._replace(plural='other')
+    assert replaced is Resource('group', 'version', 'other')
+    with pytest.raises(ValueError):
+        resource._replace(kind='other')
+
+
+def test_equality_to_tuples_is_deprecated():
+    resource = Resource('group', 'version', 'plural')
+    with pytest.deprecated_call():
+        assert resource == ('group', 'version', 'plural')
+    with pytest.deprecated_call():
+        assert ('group', 'version', 'plural') == resource
+    with pytest.deprecated_call():
+        assert resource != ('group', 'version', 'other')
+    assert hash(resource) == hash(('group', 'version', 'plural'))
+
+
 def test_api_version_of_custom_resource():
     resource = Resource('group', 'version', 'plural')
     api_version = resource.api_version
@@ -70,3 +70,10 @@ def preload(mocker):
 @pytest.fixture()
 def real_run(mocker):
     return mocker.patch('kopf.reactor.running.run')
+
+
+@pytest.fixture(autouse=True)
+def install_uvloop(mocker):
+    # Otherwise, uvloop's policy (if installed) remains for the rest of the test session.
+    # The uvloop-specific tests override this fixture to exercise the real function.
+    return mocker.patch('kopf.cli.install_uvloop')
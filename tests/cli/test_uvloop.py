@@ -0,0 +1,52 @@
+import asyncio
+import types
+
+import pytest
+
+from kopf.cli import CLIControls
+
+
+@pytest.fixture(autouse=True)
+def install_uvloop():
+    pass  # overrides the conftest's mock: use the real function here.
+
+
+@pytest.fixture()
+def set_policy(mocker):
+    return mocker.patch('asyncio.set_event_loop_policy')
+
+
+@pytest.fixture()
+def fake_uvloop(mocker):
+    module = types.ModuleType('uvloop')
+    module.EventLoopPolicy = mocker.Mock()
+    mocker.patch.dict('sys.modules', {'uvloop': module})
+    return module
+
+
+@pytest.mark.usefixtures('preload', 'real_run')
+def test_uvloop_is_used_when_installed(invoke, fake_uvloop, set_policy):
+    result = invoke(['run'])
+    assert result.exit_code == 0
+    assert set_policy.called
+    assert set_policy.call_args[0][0] is fake_uvloop.EventLoopPolicy.return_value
+
+
+@pytest.mark.usefixtures('preload', 'real_run')
+def test_uvloop_is_skipped_when_absent(invoke, mocker, set_policy):
+    mocker.patch.dict('sys.modules', {'uvloop': None})  # makes the import fail
+    result = invoke(['run'])
+    assert result.exit_code == 0
+    assert not set_policy.called
+
+
+@pytest.mark.usefixtures('preload')
+def test_uvloop_is_skipped_with_explicit_loop(invoke, fake_uvloop, set_policy, real_run):
+    loop = asyncio.new_event_loop()
+    try:
+        result = invoke(['run'], obj=CLIControls(loop=loop))
+    finally:
+        loop.close()
+    assert result.exit_code == 0
+    assert not set_policy.called
+    assert real_run.call_args[1]['loop'] is loop
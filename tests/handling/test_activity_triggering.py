@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from typing import Mapping
 
 import freezegun
@@ -20,6 +22,22 @@ def test_activity_error_exception():
     assert error.outcomes == outcomes
 
 
+@pytest.mark.parametrize('activity', list(Activity))
+async def test_no_handlers_are_shortcut(settings, activity, mocker):
+    execute = mocker.patch('kopf.reactor.handling.execute_handlers_once')
+    registry = OperatorRegistry()
+
+    results = await run_activity(
+        registry=registry,
+        settings=settings,
+        activity=activity,
+        lifecycle=all_at_once,
+    )
+
+    assert results == {}
+    assert not execute.called
+
+
 @pytest.mark.parametrize('activity', list(Activity))
 async def test_results_are_returned_on_success(settings, activity):
 
@@ -51,6 +69,99 @@ async def test_results_are_returned_on_success(settings, activity):
     assert results['id2'] == 456
 
 
+@pytest.mark.parametrize('activity', list(Activity))
+async def test_handlers_are_executed_concurrently(settings, activity):
+    event1 = asyncio.Event()
+    event2 = asyncio.Event()
+
+    # Each handler waits for the other one, so they deadlock if executed sequentially.
+    async def sample_fn1(**_):
+        event1.set()
+        await event2.wait()
+        return 123
+
+    async def sample_fn2(**_):
+        event2.set()
+        await event1.wait()
+        return 456
+
+    registry = OperatorRegistry()
+    registry.activity_handlers.append(ActivityHandler(
+        fn=sample_fn1, id='id1', activity=activity,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+    registry.activity_handlers.append(ActivityHandler(
+        fn=sample_fn2, id='id2', activity=activity,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+
+    results = await asyncio.wait_for(run_activity(
+        registry=registry,
+        settings=settings,
+        activity=activity,
+        lifecycle=all_at_once,
+        concurrent=True,
+    ), timeout=1.0)
+
+    assert results == {'id1': 123, 'id2': 456}
+
+
+@pytest.mark.parametrize('activity', list(Activity))
+async def test_concurrent_errors_are_raised_aggregated(settings, activity):
+
+    async def sample_fn1(**_):
+        raise PermanentError("boo!123")
+
+    async def sample_fn2(**_):
+        return 456
+
+    registry = OperatorRegistry()
+    registry.activity_handlers.append(ActivityHandler(
+        fn=sample_fn1, id='id1', activity=activity,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+    registry.activity_handlers.append(ActivityHandler(
+        fn=sample_fn2, id='id2', activity=activity,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+
+    with pytest.raises(ActivityError) as e:
+        await run_activity(
+            registry=registry,
+            settings=settings,
+            activity=activity,
+            lifecycle=all_at_once,
+            concurrent=True,
+        )
+
+    assert set(e.value.outcomes.keys()) == {'id1', 'id2'}
+    assert e.value.outcomes['id1'].exception is not None
+    assert e.value.outcomes['id2'].exception is None
+    assert e.value.outcomes['id2'].result == 456
+
+
+@pytest.mark.parametrize('activity', list(Activity))
+async def test_sync_handlers_are_executed_in_threads(settings, activity):
+
+    def sample_fn(**_):
+        return threading.get_ident()
+
+    registry = OperatorRegistry()
+    registry.activity_handlers.append(ActivityHandler(
+        fn=sample_fn, id='id', activity=activity,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+
+    results = await run_activity(
+        registry=registry,
+        settings=settings,
+        activity=activity,
+        lifecycle=all_at_once,
+    )
+
+    assert results['id'] != threading.get_ident()
+
+
 @pytest.mark.parametrize('activity', list(Activity))
 async def test_errors_are_raised_aggregated(settings, activity):
 
@@ -174,3 +285,65 @@ async def test_delays_are_simulated(settings, activity, mocker):
     assert sleep_or_wait.call_count <= 4  # 3 retries, 1 final success (delay=None), not more
     if sleep_or_wait.call_count > 3:
         sleep_or_wait.call_args_list[-1][0][0] is None
+
+
+@pytest.mark.parametrize('activity', list(Activity))
+async def test_zero_delays_are_not_slept(settings, activity, mocker):
+    sleep_or_wait = mocker.patch('kopf.reactor.effects.sleep_or_wait')
+    mock = mocker.MagicMock()
+
+    def sample_fn(**_):
+        mock()
+        raise TemporaryError('to be retried', delay=0)
+
+    registry = OperatorRegistry()
+    registry.activity_handlers.append(ActivityHandler(
+        fn=sample_fn, id='id', activity=activity,
+        errors=None, timeout=None, retries=3, backoff=None, cooldown=None,
+    ))
+
+    with pytest.raises(ActivityError):
+        await run_activity(
+            registry=registry,
+            settings=settings,
+            activity=activity,
+            lifecycle=all_at_once,
+        )
+
+    assert mock.call_count == 3
+    assert not sleep_or_wait.called
+
+
+@pytest.mark.parametrize('activity', list(Activity))
+async def test_short_delays_are_slept(settings, activity, mocker):
+    mock = mocker.MagicMock()
+
+    def sample_fn(**_):
+        mock()
+        raise TemporaryError('to be retried', delay=0.0005)
+
+    registry = OperatorRegistry()
+    registry.activity_handlers.append(ActivityHandler(
+        fn=sample_fn, id='id', activity=activity,
+        errors=None, timeout=None, retries=3, backoff=None, cooldown=None,
+    ))
+
+    with freezegun.freeze_time() as frozen:
+
+        async def sleep_or_wait_substitute(delay, *_, **__):
+            frozen.tick(delay)
+
+        sleep_or_wait = mocker.patch('kopf.reactor.effects.sleep_or_wait',
+                                     wraps=sleep_or_wait_substitute)
+
+        with pytest.raises(ActivityError):
+            await run_activity(
+                registry=registry,
+                settings=settings,
+                activity=activity,
+                lifecycle=all_at_once,
+            )
+
+    assert mock.call_count == 3
+    assert sleep_or_wait.call_count == 3  # 3 retries, 1 sleep each, no busy-looping.
+    assert all(0 < call[0][0] <= 0.0005 for call in sleep_or_wait.call_args_list)
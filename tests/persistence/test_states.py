@@ -121,6 +121,20 @@ def test_enriched_with_outcomes_keeps_the_original_purpose(reason):
     assert state.purpose is reason
 
 
+def test_enriched_with_outcomes_keeps_the_unaffected_handlers():
+    handler1 = Mock(id='id1', spec_set=['id'])
+    handler2 = Mock(id='id2', spec_set=['id'])
+    state = State.from_scratch()
+    state = state.with_handlers([handler1, handler2])
+    handler_state1 = state['id1']
+    handler_state2 = state['id2']
+    state = state.with_outcomes({'id2': HandlerOutcome(final=True)})
+    assert list(state) == ['id1', 'id2']
+    assert state['id1'] is handler_state1
+    assert state['id2'] is not handler_state2
+    assert state['id2'].success
+
+
 @pytest.mark.parametrize('reason', HANDLER_REASONS)
 def test_repurposed_before_handlers(handler, reason):
     state = State.from_scratch()
@@ -3,7 +3,7 @@ import collections.abc
 import pytest
 
 from kopf.reactor.causation import ResourceChangingCause, ResourceWatchingCause
-from kopf.structs.handlers import Activity
+from kopf.structs.handlers import Activity, ActivityHandler
 
 
 # Used in the tests. Must be global-scoped, or its qualname will be affected.
@@ -11,6 +11,10 @@ def some_fn():
     pass
 
 
+def other_fn():
+    pass
+
+
 def test_generic_registry_via_iter(
         generic_registry_cls, cause_factory):
 
@@ -101,6 +105,28 @@ def test_operator_registry_with_activity_via_list(
     assert not handlers
 
 
+@pytest.mark.parametrize('activity', list(Activity))
+def test_operator_registry_with_activity_cached_until_appended(
+        operator_registry_cls, activity):
+
+    registry = operator_registry_cls()
+    registry.activity_handlers.append(ActivityHandler(
+        fn=some_fn, id='id1', activity=activity,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+    handlers1 = registry.activity_handlers.get_handlers(activity=activity)
+    handlers2 = registry.activity_handlers.get_handlers(activity=activity)
+    assert handlers1 is handlers2
+
+    registry.activity_handlers.append(ActivityHandler(
+        fn=other_fn, id='id2', activity=activity,
+        errors=None, timeout=None, retries=None, backoff=None, cooldown=None,
+    ))
+    handlers3 = registry.activity_handlers.get_handlers(activity=activity)
+    assert [handler.id for handler in handlers1] == ['id1']
+    assert [handler.id for handler in handlers3] == ['id1', 'id2']
+
+
 def test_operator_registry_with_resource_watching_via_list(
         operator_registry_cls, resource, cause_factory):
 